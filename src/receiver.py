@@ -9,7 +9,7 @@ import logging
 import time
 import traceback
 from collections import defaultdict
-from typing import Dict, Any
+from typing import Dict, Set, Any
 from nlp_test import process_user_input
 
 from PyQt6.QtWidgets import (
@@ -21,9 +21,19 @@ from PyQt6.QtWidgets import (
     QPushButton,
     QLabel,
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QObject, QThread, pyqtSignal
 from PyQt6.QtGui import QImage, QPixmap
 
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+except ImportError:
+    TurboJPEG = None
+
+try:
+    from nvjpeg import NvJpeg
+except ImportError:
+    NvJpeg = None
+
 
 # Constants
 WINDOW_TITLE = "Video Stream Receiver"
@@ -36,11 +46,14 @@ UDP_IP = "127.0.0.1"
 UDP_PORT = 5005
 UDP_BIND_ADDRESS = "0.0.0.0"
 MAX_UDP_SIZE = 1400  # Safe UDP packet size
+RECV_BATCH_SIZE = 64  # Packets drained per pass over the buffer pool
 HEADER_SIZE = 12  # 4 bytes for frame number, 4 bytes for packet number, 4 bytes for total packets
-SOCKET_TIMEOUT = 1  # milliseconds
+CHUNK_SIZE = MAX_UDP_SIZE - HEADER_SIZE  # Payload bytes per packet
+SOCKET_TIMEOUT = 0.01  # seconds; blocking recv timeout on the worker thread
 MIN_JPEG_SIZE = 100
 JPEG_HEADER = b'\xff\xd8'
 FRAME_BUFFER_SIZE = 5  # Number of frames to keep in buffer
+SOCKET_RCVBUF_SIZE = 16 * 1024 * 1024  # Absorb packet bursts without drops
 
 # Logging configuration
 logging.basicConfig(
@@ -50,104 +63,159 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-class VideoReceiver(QMainWindow):
-    """Main window class for receiving and displaying video stream."""
+def log_jpeg_build_info() -> None:
+    """Log whether the installed OpenCV build has SIMD-enabled JPEG decoding.
 
-    def __init__(self) -> None:
-        """Initialize the video receiver window and setup components."""
-        super().__init__()
-        self._setup_window()
-        self._setup_ui()
-        self._setup_udp_socket()
-        self._setup_frame_buffers()
-        self._setup_timer()
+    Prebuilt OpenCV wheels sometimes bundle libjpeg-turbo with its SIMD code
+    paths disabled, which roughly halves imdecode throughput. See
+    docs/performance.md for how to install a SIMD-enabled build.
+    """
+    jpeg_lines = [
+        line.strip() for line in cv2.getBuildInformation().splitlines()
+        if 'JPEG' in line
+    ]
+    if jpeg_lines:
+        logger.info(f"OpenCV JPEG build info: {'; '.join(jpeg_lines)}")
+    else:
+        logger.warning("OpenCV build information has no JPEG entry")
 
-    def _setup_window(self) -> None:
-        """Configure the main window properties."""
-        self.setWindowTitle(WINDOW_TITLE)
-        self.setGeometry(WINDOW_X_POS, WINDOW_Y_POS, WINDOW_WIDTH, WINDOW_HEIGHT)
-
-    def _setup_ui(self) -> None:
-        """Setup the user interface components."""
-        # Create central widget and layout
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
-        layout = QVBoxLayout(central_widget)
 
-        # Video display label - give it much more space
-        self.video_label = QLabel()
-        self.video_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.video_label.setMinimumHeight(400)  # Set minimum height for video
-        layout.addWidget(self.video_label, 1)  # Give it stretch factor of 1
+class ReceiverWorker(QObject):
+    """Receives, reassembles and decodes the UDP video stream.
 
-        # Text input and submit button - keep compact
-        self.text_input = QLineEdit()
-        self.text_input.setPlaceholderText("Filter the video color...")
-        layout.addWidget(self.text_input, 0)  # No stretch - keep compact
+    Runs on a dedicated QThread so packet draining and JPEG decode never
+    compete with Qt paint events on the GUI thread; decoded frames are
+    handed to the GUI via the frame_ready signal.
+    """
 
-        submit_button = QPushButton("Submit")
-        submit_button.clicked.connect(self.handle_submit)
-        layout.addWidget(submit_button, 0)  # No stretch - keep compact
+    frame_ready = pyqtSignal(np.ndarray)
+    status_changed = pyqtSignal(str)
 
-        # User input display label - keep compact
-        self.user_input_label = QLabel("")
-        self.user_input_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.user_input_label.setStyleSheet("""
-            QLabel {
-                font-size: 14px;
-                font-weight: bold;
-                color: #2c3e50;
-                padding: 10px;
-                background-color: #ecf0f1;
-                border-radius: 5px;
-                margin: 5px;
-            }
-        """)
-        self.user_input_label.setWordWrap(True)
-        layout.addWidget(self.user_input_label, 0)  # No stretch - keep compact
+    def __init__(self) -> None:
+        """Initialize decoder, socket and frame buffers."""
+        super().__init__()
+        self._running = True
+        # Precompiled header codec; unpack_from reads the packet view in
+        # place without slicing a header bytes object per packet.
+        self._hdr_struct = struct.Struct('>III')
+        # Target display size, updated by the GUI thread on resize; used to
+        # pick the TurboJPEG scaling factor.
+        self.target_width = WINDOW_WIDTH
+        self.target_height = WINDOW_HEIGHT
+        self._setup_decoder()
+        self._setup_udp_socket()
+        self._setup_frame_buffers()
 
-        # Status label - keep compact
-        self.status_label = QLabel("Waiting for video stream...")
-        layout.addWidget(self.status_label, 0)  # No stretch - keep compact
+    def _setup_decoder(self) -> None:
+        """Initialize the JPEG decoder: nvJPEG, then TurboJPEG, then OpenCV.
+
+        nvJPEG runs dequantization, IDCT and colorspace conversion on the
+        GPU, freeing the CPU for the Qt event loop. TurboJPEG decodes
+        straight to RGB, avoiding the extra full-image BGR-to-RGB pass
+        that the OpenCV path needs before display.
+        """
+        self.nv = None
+        self.tj = None
+        if NvJpeg is not None:
+            try:
+                self.nv = NvJpeg()
+                logger.info("Using nvJPEG (GPU) for frame decoding")
+                return
+            except Exception as e:
+                logger.warning(f"nvJPEG unavailable, trying TurboJPEG: {e}")
+        if TurboJPEG is not None:
+            try:
+                self.tj = TurboJPEG()
+                logger.info("Using TurboJPEG for frame decoding")
+            except Exception as e:
+                logger.warning(f"TurboJPEG unavailable, falling back to OpenCV: {e}")
+        else:
+            logger.info("PyTurboJPEG not installed, using OpenCV for frame decoding")
 
     def _setup_udp_socket(self) -> None:
         """Initialize and configure the UDP socket."""
+        # Preallocated receive buffers, reused for every packet so the hot
+        # path does no per-packet allocation. Allocated up front so the
+        # receive loop never sees a partially initialized worker.
+        self._recv_buffers = [bytearray(MAX_UDP_SIZE) for _ in range(RECV_BATCH_SIZE)]
+        self._recv_views = [memoryview(buf) for buf in self._recv_buffers]
+        self._bind_error = None
+
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        # A large kernel receive buffer rides out bursts (a frame arrives as
+        # dozens of back-to-back packets) and GC pauses; the default ~212KB
+        # overflows silently under load. The kernel caps this at
+        # net.core.rmem_max on Linux, so raise that too if needed.
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_RCVBUF_SIZE)
+        effective = self.sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+        if effective < SOCKET_RCVBUF_SIZE:
+            logger.warning(
+                f"SO_RCVBUF capped at {effective} bytes "
+                f"(requested {SOCKET_RCVBUF_SIZE}); check net.core.rmem_max"
+            )
         try:
             self.sock.bind((UDP_BIND_ADDRESS, UDP_PORT))
             logger.info(f"Successfully bound to port {UDP_PORT}")
         except Exception as e:
             logger.error(f"Failed to bind to port {UDP_PORT}: {e}")
-            self.status_label.setText(f"Error: Failed to bind to port {UDP_PORT}")
+            self._bind_error = f"Error: Failed to bind to port {UDP_PORT}"
             return
 
-        self.sock.setblocking(False)  # Non-blocking socket
+        # Blocking with a short timeout: the worker thread sleeps in the
+        # kernel until packets arrive instead of polling on a timer.
+        self.sock.settimeout(SOCKET_TIMEOUT)
 
     def _setup_frame_buffers(self) -> None:
-        """Initialize frame buffer data structures."""
-        self.frame_buffers: Dict[int, Dict[int, bytes]] = defaultdict(dict)
+        """Initialize frame buffer data structures.
+
+        Each in-flight frame gets one preallocated bytearray slab sized for
+        all its packets; fragments are written straight into their offset so
+        a complete frame needs no reassembly pass.
+        """
+        self.frame_slabs: Dict[int, bytearray] = {}
+        self.frame_seen: Dict[int, Set[int]] = defaultdict(set)
+        self.frame_lengths: Dict[int, int] = defaultdict(int)
         self.frame_total_packets: Dict[int, int] = {}
         self.current_frame = 0
         self.last_log_time = time.time()
         self.packets_received = 0
 
-    def _setup_timer(self) -> None:
-        """Setup the timer for checking UDP socket."""
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.check_socket)
-        self.timer.start(SOCKET_TIMEOUT)
-        logger.info("Receiver initialized and waiting for video stream")
+    def set_target_size(self, width: int, height: int) -> None:
+        """Update the display size used to choose the decode scale."""
+        self.target_width = max(width, 1)
+        self.target_height = max(height, 1)
+
+    def stop(self) -> None:
+        """Ask the receive loop to exit."""
+        self._running = False
+
+    def run(self) -> None:
+        """Receive loop: drain packets, reassemble and decode frames."""
+        if self._bind_error is not None:
+            # Reported here rather than from __init__, which runs before
+            # the GUI has connected to status_changed.
+            self.status_changed.emit(self._bind_error)
+            self.sock.close()
+            return
+        logger.info("Receiver worker started and waiting for video stream")
+        while self._running:
+            self._drain_socket()
+        self.sock.close()
+        logger.info("Receiver worker stopped")
 
-    def check_socket(self) -> None:
-        """Check for new UDP packets and process them."""
+    def _drain_socket(self) -> None:
+        """Drain queued UDP packets into the buffer pool and process them."""
         try:
-            while True:  # Process all available packets
-                data, addr = self.sock.recvfrom(MAX_UDP_SIZE)
+            for view in self._recv_views:
+                try:
+                    nbytes, _, _, _ = self.sock.recvmsg_into([view])
+                except socket.timeout:
+                    break
                 self.packets_received += 1
 
                 # Log packet statistics every second
                 current_time = time.time()
-                # Remove in production
                 if current_time - self.last_log_time >= 1.0:
                     logger.info(
                         f"Received {self.packets_received} packets in the last second"
@@ -155,42 +223,55 @@ class VideoReceiver(QMainWindow):
                     self.packets_received = 0
                     self.last_log_time = current_time
 
-                if len(data) < HEADER_SIZE:
-                    logger.warning(f"Received packet too small: {len(data)} bytes")
+                if nbytes < HEADER_SIZE:
+                    logger.warning(f"Received packet too small: {nbytes} bytes")
                     continue
 
-                self._process_packet(data)
+                self._process_packet(view[:nbytes])
 
-        except BlockingIOError:
-            pass  # No data available
+        except OSError as e:
+            if self._running:
+                logger.error(f"Socket error in receive loop: {e}")
+                self.status_changed.emit(f"Error: {str(e)}")
         except Exception as e:
-            logger.error(f"Error in check_socket: {e}")
-            self.status_label.setText(f"Error: {str(e)}")
+            logger.error(f"Error in receive loop: {e}")
+            self.status_changed.emit(f"Error: {str(e)}")
 
-    def _process_packet(self, data: bytes) -> None:
+    def _process_packet(self, data: memoryview) -> None:
         """Process a single UDP packet."""
-        header = data[:HEADER_SIZE]
         try:
-            frame_number, packet_num, total_packets = struct.unpack('>III', header)
+            frame_number, packet_num, total_packets = self._hdr_struct.unpack_from(data)
             packet_data = data[HEADER_SIZE:]
 
             # Store total packets for this frame
             self.frame_total_packets[frame_number] = total_packets
 
-            # Log first and last packet of each frame
+            # Log first and last packet of each frame. Lazy %-formatting:
+            # at thousands of packets/s the f-string would be evaluated
+            # even with the DEBUG level filtered out.
             if packet_num == 0:
-                logger.info(
-                    f"Received start of frame {frame_number}, "
-                    f"expecting {total_packets} packets"
+                logger.debug(
+                    "Received start of frame %d, expecting %d packets",
+                    frame_number, total_packets
                 )
             elif packet_num == total_packets - 1:
-                logger.info(
-                    f"Received end of frame {frame_number}, "
-                    f"packet {packet_num}/{total_packets-1}"
+                logger.debug(
+                    "Received end of frame %d, packet %d/%d",
+                    frame_number, packet_num, total_packets - 1
                 )
 
-            # Store packet in frame buffer
-            self.frame_buffers[frame_number][packet_num] = packet_data
+            # Scatter the payload straight into the frame slab. The slice
+            # assignment copies out of the pooled receive buffer, so this is
+            # the only copy the fragment ever makes.
+            if frame_number not in self.frame_slabs:
+                self.frame_slabs[frame_number] = bytearray(total_packets * CHUNK_SIZE)
+            seen = self.frame_seen[frame_number]
+            if packet_num not in seen:
+                offset = packet_num * CHUNK_SIZE
+                slab = memoryview(self.frame_slabs[frame_number])
+                slab[offset:offset + len(packet_data)] = packet_data
+                seen.add(packet_num)
+                self.frame_lengths[frame_number] += len(packet_data)
 
             # Try to process complete frames
             self.process_complete_frames()
@@ -200,99 +281,243 @@ class VideoReceiver(QMainWindow):
 
     def process_complete_frames(self) -> None:
         """Process any complete frames in the buffer."""
-        while self.current_frame in self.frame_buffers:
-            frame_packets = self.frame_buffers[self.current_frame]
+        while self.current_frame in self.frame_slabs:
             total_packets = self.frame_total_packets.get(self.current_frame)
 
             if total_packets is None:
                 logger.warning(f"No total packet count for frame {self.current_frame}")
                 break
 
-            if not self._is_frame_complete(frame_packets, total_packets):
+            if not self._is_frame_complete(self.frame_seen[self.current_frame], total_packets):
                 break
 
-            frame_data = self._reassemble_frame(frame_packets, total_packets)
+            frame_length = self.frame_lengths[self.current_frame]
+            logger.debug(
+                "Processing complete frame %d (%d bytes)",
+                self.current_frame, frame_length
+            )
+            # Fragments are contiguous in the slab, so the JPEG data is just
+            # its first frame_length bytes — no reassembly needed.
+            frame_data = memoryview(self.frame_slabs[self.current_frame])[:frame_length]
             self.process_frame(frame_data)
             self._cleanup_processed_frame()
 
-    def _is_frame_complete(self, frame_packets: Dict[int, bytes], total_packets: int) -> bool:
+    def _is_frame_complete(self, seen: Set[int], total_packets: int) -> bool:
         """Check if all packets for a frame have been received."""
-        if len(frame_packets) != total_packets:
-            missing = set(range(total_packets)) - set(frame_packets.keys())
-            logger.info(
-                f"Frame {self.current_frame}: have {len(frame_packets)}/{total_packets} "
-                f"packets, missing: {missing}"
-            )
+        if len(seen) != total_packets:
+            if logger.isEnabledFor(logging.DEBUG):
+                missing = set(range(total_packets)) - seen
+                logger.debug(
+                    "Frame %d: have %d/%d packets, missing: %s",
+                    self.current_frame, len(seen), total_packets, missing
+                )
             return False
         return True
 
-    def _reassemble_frame(self, frame_packets: Dict[int, bytes], total_packets: int) -> bytes:
-        """Reassemble frame data from packets."""
-        frame_data = b''
-        for i in range(total_packets):
-            frame_data += frame_packets[i]
-        logger.info(
-            f"Processing complete frame {self.current_frame} "
-            f"({len(frame_data)} bytes)"
-        )
-        return frame_data
-
     def _cleanup_processed_frame(self) -> None:
         """Clean up processed frame and old frames."""
-        del self.frame_buffers[self.current_frame]
-        del self.frame_total_packets[self.current_frame]
+        self._discard_frame(self.current_frame)
         self.current_frame += 1
 
         # Clean up old frames
-        old_frames = [f for f in self.frame_buffers if f < self.current_frame - FRAME_BUFFER_SIZE]
+        old_frames = [f for f in self.frame_slabs if f < self.current_frame - FRAME_BUFFER_SIZE]
         for f in old_frames:
             logger.debug(f"Cleaning up old frame {f}")
-            del self.frame_buffers[f]
-            if f in self.frame_total_packets:
-                del self.frame_total_packets[f]
+            self._discard_frame(f)
+
+    def _discard_frame(self, frame_number: int) -> None:
+        """Drop all buffered state for a frame."""
+        self.frame_slabs.pop(frame_number, None)
+        self.frame_seen.pop(frame_number, None)
+        self.frame_lengths.pop(frame_number, None)
+        self.frame_total_packets.pop(frame_number, None)
 
-    def process_frame(self, jpeg_data: bytes) -> None:
-        """Process and display a JPEG frame."""
+    def process_frame(self, jpeg_data: memoryview) -> None:
+        """Decode a JPEG frame and hand it to the GUI."""
         try:
-            logger.info(f"Starting to process frame, JPEG data size: {len(jpeg_data)} bytes")
+            logger.debug("Starting to process frame, JPEG data size: %d bytes", len(jpeg_data))
 
             if not self._validate_jpeg_data(jpeg_data):
                 return
 
             frame = self._decode_jpeg_frame(jpeg_data)
             if frame is not None:
-                self._display_frame(frame)
+                self.frame_ready.emit(frame)
             else:
                 self._handle_decode_error(jpeg_data)
 
         except Exception as e:
             logger.error(f"Frame processing error: {e}")
             logger.error(f"Traceback: {traceback.format_exc()}")
-            self.status_label.setText(f"Frame processing error: {str(e)}")
+            self.status_changed.emit(f"Frame processing error: {str(e)}")
 
-    def _validate_jpeg_data(self, jpeg_data: bytes) -> bool:
+    def _validate_jpeg_data(self, jpeg_data: memoryview) -> bool:
         """Validate JPEG data before processing."""
         if len(jpeg_data) < MIN_JPEG_SIZE:
             logger.error(f"Frame data too small: {len(jpeg_data)} bytes")
             return False
 
-        if not jpeg_data.startswith(JPEG_HEADER):
+        if bytes(jpeg_data[:len(JPEG_HEADER)]) != JPEG_HEADER:
             logger.error("Data doesn't start with JPEG header")
-            logger.error(f"First 10 bytes: {jpeg_data[:10]}")
+            logger.error(f"First 10 bytes: {bytes(jpeg_data[:10])}")
             return False
 
         return True
 
-    def _decode_jpeg_frame(self, jpeg_data: bytes) -> np.ndarray:
-        """Decode JPEG data into a numpy array."""
+    def _choose_scaling_factor(self, jpeg_data: memoryview) -> tuple:
+        """Pick the largest TurboJPEG downscale that still covers the label.
+
+        libjpeg-turbo can apply 1/2, 1/4 and 1/8 scaling inside the IDCT,
+        which skips most of the decode work compared to decoding at full
+        resolution and resizing afterwards.
+        """
+        width, height, _, _ = self.tj.decode_header(jpeg_data)
+
+        chosen = (1, 1)
+        for denom in (2, 4, 8):
+            if width // denom >= self.target_width and height // denom >= self.target_height:
+                chosen = (1, denom)
+            else:
+                break
+        return chosen
+
+    def _decode_jpeg_frame(self, jpeg_data: memoryview) -> np.ndarray:
+        """Decode JPEG data into an RGB numpy array."""
+        if self.nv is not None:
+            frame = self.nv.decode(bytes(jpeg_data))  # nvJPEG requires bytes
+            if frame is None:
+                return None
+            # In-place channel swap (OpenCV vectorizes this); avoids
+            # allocating a second full-frame buffer.
+            return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame)
+        if self.tj is not None:
+            return self.tj.decode(
+                jpeg_data,
+                pixel_format=TJPF_RGB,
+                scaling_factor=self._choose_scaling_factor(jpeg_data),
+            )
+
         nparr = np.frombuffer(jpeg_data, np.uint8)
-        logger.info(f"Converted to numpy array of size: {nparr.size}")
-        return cv2.imdecode(nparr, cv2.COLOR_BGR2GRAY)
+        frame = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+        if frame is None:
+            return None
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame)
+
+    def _handle_decode_error(self, jpeg_data: memoryview) -> None:
+        """Handle JPEG decode errors."""
+        logger.error(
+            f"Failed to decode JPEG frame, data size: {len(jpeg_data)} bytes"
+        )
+        logger.error(f"First 20 bytes: {bytes(jpeg_data[:20])}")
+
+
+class VideoReceiver(QMainWindow):
+    """Main window class for receiving and displaying video stream."""
+
+    def __init__(self) -> None:
+        """Initialize the video receiver window and setup components."""
+        super().__init__()
+        self._setup_window()
+        self._setup_ui()
+        # Reusable RGB buffer the display resize writes into; reallocated
+        # only when the target size changes, not per frame.
+        self._display_buf: np.ndarray = None
+        self._setup_worker()
+
+    def _setup_window(self) -> None:
+        """Configure the main window properties."""
+        self.setWindowTitle(WINDOW_TITLE)
+        self.setGeometry(WINDOW_X_POS, WINDOW_Y_POS, WINDOW_WIDTH, WINDOW_HEIGHT)
+
+    def _setup_ui(self) -> None:
+        """Setup the user interface components."""
+        # Create central widget and layout
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        layout = QVBoxLayout(central_widget)
+
+        # Video display label - give it much more space
+        self.video_label = QLabel()
+        self.video_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.video_label.setMinimumHeight(400)  # Set minimum height for video
+        layout.addWidget(self.video_label, 1)  # Give it stretch factor of 1
+
+        # Text input and submit button - keep compact
+        self.text_input = QLineEdit()
+        self.text_input.setPlaceholderText("Filter the video color...")
+        layout.addWidget(self.text_input, 0)  # No stretch - keep compact
+
+        submit_button = QPushButton("Submit")
+        submit_button.clicked.connect(self.handle_submit)
+        layout.addWidget(submit_button, 0)  # No stretch - keep compact
+
+        # User input display label - keep compact
+        self.user_input_label = QLabel("")
+        self.user_input_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.user_input_label.setStyleSheet("""
+            QLabel {
+                font-size: 14px;
+                font-weight: bold;
+                color: #2c3e50;
+                padding: 10px;
+                background-color: #ecf0f1;
+                border-radius: 5px;
+                margin: 5px;
+            }
+        """)
+        self.user_input_label.setWordWrap(True)
+        layout.addWidget(self.user_input_label, 0)  # No stretch - keep compact
+
+        # Status label - keep compact
+        self.status_label = QLabel("Waiting for video stream...")
+        layout.addWidget(self.status_label, 0)  # No stretch - keep compact
+
+    def _setup_worker(self) -> None:
+        """Start the receiver worker on its own thread."""
+        self.worker = ReceiverWorker()
+        self.receiver_thread = QThread()
+        self.worker.moveToThread(self.receiver_thread)
+        self.receiver_thread.started.connect(self.worker.run)
+        self.worker.frame_ready.connect(self._display_frame)
+        self.worker.status_changed.connect(self.status_label.setText)
+        self.receiver_thread.start()
+
+    def resizeEvent(self, event: Any) -> None:
+        """Keep the worker's decode target in sync with the label size."""
+        super().resizeEvent(event)
+        size = self.video_label.size()
+        self.worker.set_target_size(size.width(), size.height())
+
+    def _label_fit_size(self, width: int, height: int) -> tuple:
+        """Aspect-preserving size of a frame fitted into the video label."""
+        label_size = self.video_label.size()
+        scale = min(
+            max(label_size.width(), 1) / width,
+            max(label_size.height(), 1) / height,
+        )
+        return max(int(width * scale), 1), max(int(height * scale), 1)
 
     def _display_frame(self, frame: np.ndarray) -> None:
         """Display the processed frame."""
         height, width, channel = frame.shape
-        logger.info(f"Successfully decoded JPEG to image of size {width}x{height}")
+        logger.debug("Successfully decoded JPEG to image of size %dx%d", width, height)
+
+        # Resize into the persistent display buffer (vectorized OpenCV
+        # bilinear) so Qt gets a final-size image, never runs its scaler
+        # on the GUI thread, and the hot path allocates nothing.
+        target_width, target_height = self._label_fit_size(width, height)
+        if (target_width, target_height) != (width, height):
+            if (self._display_buf is None
+                    or self._display_buf.shape[:2] != (target_height, target_width)):
+                self._display_buf = np.empty((target_height, target_width, 3), np.uint8)
+            cv2.resize(
+                frame,
+                (target_width, target_height),
+                dst=self._display_buf,
+                interpolation=cv2.INTER_LINEAR,
+            )
+            frame = self._display_buf
+            height, width = target_height, target_width
 
         # Convert frame to QImage
         bytes_per_line = 3 * width
@@ -303,36 +528,17 @@ class VideoReceiver(QMainWindow):
             bytes_per_line,
             QImage.Format.Format_RGB888
         )
-        q_img = q_img.rgbSwapped()  # Convert BGR to RGB
-        logger.info("Converted to QImage")
 
-        # Scale and display image
         pixmap = QPixmap.fromImage(q_img)
         if pixmap.isNull():
             logger.error("Failed to create QPixmap from QImage")
             return
+        logger.debug("Scaled image to %dx%d", pixmap.width(), pixmap.height())
 
-        scaled_pixmap = pixmap.scaled(
-            self.video_label.size(),
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
-        logger.info(
-            f"Scaled image to {scaled_pixmap.width()}x{scaled_pixmap.height()}"
-        )
-
-        self.video_label.setPixmap(scaled_pixmap)
+        self.video_label.setPixmap(pixmap)
         self.status_label.setText(
             f"Receiving video stream... Frame size: {width}x{height}"
         )
-        logger.info("Successfully displayed frame")
-
-    def _handle_decode_error(self, jpeg_data: bytes) -> None:
-        """Handle JPEG decode errors."""
-        logger.error(
-            f"Failed to decode JPEG frame, data size: {len(jpeg_data)} bytes"
-        )
-        logger.error(f"First 20 bytes: {jpeg_data[:20]}")
 
     def handle_submit(self) -> None:
         """Handle text input submission."""
@@ -340,10 +546,10 @@ class VideoReceiver(QMainWindow):
         if text:
             print(f"User submitted: {text}")
             self.text_input.clear()
-            
+
             # Update the user input display label
             self.user_input_label.setText(f"Received user input: {text}")
-            
+
             # Also update status label as backup
             self.status_label.setText(f"Last submission: {text}")
         else:
@@ -353,13 +559,15 @@ class VideoReceiver(QMainWindow):
     def closeEvent(self, event: Any) -> None:
         """Clean up when window is closed."""
         logger.info("Closing receiver...")
-        self.timer.stop()
-        self.sock.close()
+        self.worker.stop()
+        self.receiver_thread.quit()
+        self.receiver_thread.wait()
         event.accept()
 
 
 def main() -> None:
     """Main entry point for the application."""
+    log_jpeg_build_info()
     app = QApplication(sys.argv)
     window = VideoReceiver()
     window.show()
@@ -367,4 +575,4 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
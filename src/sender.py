@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import cv2
+import ctypes
 import socket
 import time
 import sys
@@ -9,6 +10,11 @@ import logging
 from pathlib import Path
 from logging.handlers import RotatingFileHandler
 
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR
+except ImportError:
+    TurboJPEG = None
+
 os.makedirs('logs', exist_ok=True)
 
 logger = logging.getLogger(__name__)
@@ -43,6 +49,86 @@ UDP_IP = "127.0.0.1"
 UDP_PORT = 5005
 MAX_UDP_SIZE = 1400  # Safe UDP packet size
 HEADER_SIZE = 12  # 4 bytes for frame number, 4 bytes for packet number, 4 bytes for total packets
+CHUNK_SIZE = MAX_UDP_SIZE - HEADER_SIZE  # Payload bytes per packet
+TARGET_FPS = 30
+JPEG_QUALITY = 80
+
+
+# sendmmsg(2) via ctypes: pushes every packet of a frame to the kernel in
+# one syscall instead of one sendto per packet. Linux-only; other
+# platforms fall back to a plain send loop.
+class _iovec(ctypes.Structure):
+    _fields_ = [
+        ("iov_base", ctypes.c_void_p),
+        ("iov_len", ctypes.c_size_t),
+    ]
+
+
+class _msghdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_iovec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _mmsghdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_hdr", _msghdr),
+        ("msg_len", ctypes.c_uint),
+    ]
+
+
+_sendmmsg = None
+if sys.platform == 'linux':  # sendmmsg(2) is Linux-only
+    try:
+        _libc = ctypes.CDLL(None, use_errno=True)
+        _sendmmsg = _libc.sendmmsg
+    except (OSError, AttributeError):
+        pass
+
+
+def _send_packets(sock, packet_buf, packet_lengths):
+    """Send one frame's packets from the preallocated slab.
+
+    Uses a single sendmmsg syscall on Linux; falls back to one send per
+    packet elsewhere. The socket must be connected.
+    """
+    num_packets = len(packet_lengths)
+    if _sendmmsg is None:
+        view = memoryview(packet_buf)
+        for i, length in enumerate(packet_lengths):
+            start = i * MAX_UDP_SIZE
+            sock.send(view[start:start + length])
+        return
+
+    backing = (ctypes.c_char * len(packet_buf)).from_buffer(packet_buf)
+    base_addr = ctypes.addressof(backing)
+    iovecs = (_iovec * num_packets)()
+    headers = (_mmsghdr * num_packets)()
+    for i, length in enumerate(packet_lengths):
+        iovecs[i].iov_base = base_addr + i * MAX_UDP_SIZE
+        iovecs[i].iov_len = length
+        headers[i].msg_hdr.msg_iov = ctypes.pointer(iovecs[i])
+        headers[i].msg_hdr.msg_iovlen = 1
+
+    sent = 0
+    while sent < num_packets:
+        ret = _sendmmsg(
+            sock.fileno(),
+            ctypes.byref(headers, sent * ctypes.sizeof(_mmsghdr)),
+            num_packets - sent,
+            0,
+        )
+        if ret < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        sent += ret
+
 
 def send_video(video_path):
     """Send video frames over UDP, simulating FPGA behavior."""
@@ -51,12 +137,30 @@ def send_video(video_path):
         return
 
     sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.connect((UDP_IP, UDP_PORT))
     cap = cv2.VideoCapture(video_path)
     frame_number = 0
 
+    # TurboJPEG encodes BGR capture frames directly (SIMD, no ndarray to
+    # bytes copy); fall back to cv2.imencode if it is not installed.
+    tj = None
+    if TurboJPEG is not None:
+        try:
+            tj = TurboJPEG()
+            logger.info("Using TurboJPEG for frame encoding")
+        except Exception as e:
+            logger.warning(f"TurboJPEG unavailable, falling back to OpenCV: {e}")
+
+    # Packets are built in place in this slab (header|chunk per
+    # MAX_UDP_SIZE slot), grown as needed for large frames.
+    packet_buf = bytearray(64 * MAX_UDP_SIZE)
+
     logger.info(f"Starting video stream from {video_path}")
     logger.info(f"Sending to {UDP_IP}:{UDP_PORT}")
 
+    frame_interval = 1.0 / TARGET_FPS
+    next_frame_time = time.monotonic()
+
     try:
         while cap.isOpened():
             ret, frame = cap.read()
@@ -66,37 +170,48 @@ def send_video(video_path):
                 continue
 
             # Encode frame to JPEG
-            _, encoded = cv2.imencode('.jpg', frame)
-            data = encoded.tobytes()
-            
+            if tj is not None:
+                data = tj.encode(frame, quality=JPEG_QUALITY, pixel_format=TJPF_BGR)
+            else:
+                _, encoded = cv2.imencode('.jpg', frame)
+                data = encoded.tobytes()
+
             # Calculate number of packets needed for this frame
-            total_packets = (len(data) + MAX_UDP_SIZE - HEADER_SIZE - 1) // (MAX_UDP_SIZE - HEADER_SIZE)
+            total_packets = (len(data) + CHUNK_SIZE - 1) // CHUNK_SIZE
             logger.info(f"Frame {frame_number}: Sending {total_packets} packets, total size {len(data)} bytes")
-            
-            # Split into UDP-sized chunks with headers
+
+            if len(packet_buf) < total_packets * MAX_UDP_SIZE:
+                packet_buf = bytearray(total_packets * MAX_UDP_SIZE)
+
+            # Build header|chunk packets in place, no per-packet concat
+            packet_lengths = []
             for packet_num in range(total_packets):
-                start = packet_num * (MAX_UDP_SIZE - HEADER_SIZE)
-                end = min(start + (MAX_UDP_SIZE - HEADER_SIZE), len(data))
-                chunk = data[start:end]
-                
-                # Create header (frame number, packet number, total packets)
-                header = struct.pack('>III', frame_number, packet_num, total_packets)
-                packet = header + chunk
-                
-                try:
-                    sock.sendto(packet, (UDP_IP, UDP_PORT))
-                    if packet_num == 0:  # Log first packet
-                        logger.info(f"Sent start of frame {frame_number}, total packets: {total_packets}")
-                    elif packet_num == total_packets - 1:  # Log last packet
-                        logger.info(f"Sent end of frame {frame_number}, packet {packet_num}/{total_packets-1}")
-                except Exception as e:
-                    logger.error(f"Error sending packet: {e}")
-
-                time.sleep(0.001)  # Small delay between packets
+                start = packet_num * CHUNK_SIZE
+                end = min(start + CHUNK_SIZE, len(data))
+                slot = packet_num * MAX_UDP_SIZE
+                struct.pack_into(
+                    '>III', packet_buf, slot,
+                    frame_number, packet_num, total_packets
+                )
+                packet_buf[slot + HEADER_SIZE:slot + HEADER_SIZE + (end - start)] = data[start:end]
+                packet_lengths.append(HEADER_SIZE + (end - start))
+
+            try:
+                _send_packets(sock, packet_buf, packet_lengths)
+                logger.info(f"Sent frame {frame_number} ({total_packets} packets)")
+            except Exception as e:
+                logger.error(f"Error sending frame {frame_number}: {e}")
 
             frame_number += 1
-            # Simulate 30 FPS
-            time.sleep(1/30)
+
+            # Pace frames against a monotonic schedule instead of sleeping
+            # per packet; drift is absorbed, not accumulated.
+            next_frame_time += frame_interval
+            delay = next_frame_time - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_frame_time = time.monotonic()  # Fell behind; resync
 
     except KeyboardInterrupt:
         logger.info("\nStopping video sender...")